@@ -1,10 +1,6 @@
 import streamlit as st
-import pandas as pd
-import random
 import re
-import time
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from pathlib import Path
 
 # --- 1. CONFIGURATION & STYLING (Enhanced) ---
 
@@ -16,103 +12,60 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for a professional, dark-themed interface and responsiveness
-st.markdown("""
-    <style>
-    /* Main container styling for dark theme */
-    .stApp {
-        background-color: #0d1117; /* GitHub Dark Mode color */
-        color: #e6edf3;
-        font-family: 'Inter', sans-serif;
-    }
-    /* Restrict max width of content on large screens for readability */
-    .main .block-container {
-        max-width: 1000px;
-        padding-top: 3rem;
-        padding-right: 2rem;
-        padding-left: 2rem;
-    }
-
-    /* Header and Title Styling */
-    h1, .st-emotion-cache-12fmw37 {
-        color: #58a6ff; /* Soft blue for emphasis */
-        font-weight: 800;
-        text-align: center;
-        margin-bottom: 0.5rem;
-    }
-    h2 {
-        color: #c9d1d9;
-        font-weight: 600;
-        border-bottom: 1px solid #30363d;
-        padding-bottom: 10px;
-        margin-top: 25px;
-    }
-    
-    /* Text Area Styling */
-    textarea {
-        border: 2px solid #30363d !important;
-        border-radius: 10px !important;
-        background-color: #161b22 !important;
-        color: #ffffff !important;
-        padding: 15px;
-        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.5);
-        font-family: monospace;
-    }
-
-    /* Primary Button Styling (Analyze) */
-    .stButton button {
-        border-radius: 8px;
-        font-weight: bold;
-        transition: all 0.3s ease;
-        padding: 10px 20px;
-        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
-    }
-    .stButton button[kind="primary"] {
-        background-color: #58a6ff; /* GitHub blue */
-        color: white;
-        border: none;
-    }
-    .stButton button[kind="primary"]:hover {
-        background-color: #79c0ff;
-        transform: translateY(-2px);
-    }
-
-    /* Secondary Buttons (Examples) */
-    .stButton button:not([kind="primary"]) {
-        background-color: #30363d;
-        color: #c9d1d9;
-        border: 1px solid #484f58;
-    }
-    .stButton button:not([kind="primary"]):hover {
-        background-color: #484f58;
-        transform: translateY(-1px);
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background-color: #161b22;
-        padding: 1.5rem;
-    }
+# Custom CSS for a professional, dark-themed interface and responsiveness (see style.css)
+@st.cache_data
+def load_css():
+    """Reads the app stylesheet once and returns it wrapped in a <style> tag."""
+    return f"<style>{(Path(__file__).parent / 'style.css').read_text(encoding='utf-8')}</style>"
+
 
-    /* Correction Link Styling */
-    .correction-link a {
-        color: #79c0ff !important;
-        text-decoration: underline;
-        font-weight: 500;
-    }
+# --- 2. MOCK MODEL SETUP (The "Engine" of the Detector) ---
 
-    </style>
-    """, unsafe_allow_html=True)
+def load_sklearn():
+    """Imports the scikit-learn classes for a real model on first use only.
 
+    The mock below doesn't need them, so the app never pays the sklearn import
+    cost unless a real model is loaded (from inside a cached loader).
+    """
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import LogisticRegression
+    return HashingVectorizer, LogisticRegression
+
+
+def make_hashing_vectorizer():
+    """Stateless vectorizer for the real model (no fitted vocabulary to look up).
+
+    Normalization is disabled here because rows are L2-normalized after IDF
+    weighting in predict_proba_batch, matching TfidfVectorizer's output.
+    """
+    HashingVectorizer, _ = load_sklearn()
+    return HashingVectorizer(n_features=2**18, alternate_sign=False, norm=None)
+
+
+def predict_proba_batch(texts, vectorizer, idf, coef, intercept):
+    """
+    Scores a batch of articles with a hashed TF-IDF + logistic regression model.
+    `idf` is a precomputed ndarray of length n_features and `coef` a dense
+    float32 vector taken from a fitted LogisticRegression.coef_.
+    Returns the probability of each article being real news.
+    """
+    import numpy as np
+    from sklearn.preprocessing import normalize
+
+    X = vectorizer.transform(texts)
+    # Weight the CSR values in place instead of multiplying by a diagonal IDF matrix
+    X.data *= idf[X.indices]
+    normalize(X, copy=False)
+    logits = X.dot(coef) + intercept
+    return 1.0 / (1.0 + np.exp(-logits))
 
-# --- 2. MOCK MODEL SETUP (The "Engine" of the Detector) ---
 
 @st.cache_resource
 def load_mock_model():
     """Mocks the loading of a pre-trained model and vectorizer."""
     class MockVectorizer:
         def transform(self, data):
-            return pd.Series([1, 0, 1])
+            return [1, 0, 1]
     class MockModel:
         def predict(self, features):
             return features[0]
@@ -120,26 +73,50 @@ def load_mock_model():
 
 mock_assets = load_mock_model()
 
+SENSATIONAL_WORDS = frozenset({"shocking", "bombshell", "must-see", "disaster", "urgent alert", "massive cover-up", "secretly", "experts agree", "share this immediately", "reveals all", "exposed", "scandal", "breaking now", "lie", "fraud"})
+
+# Compiled once at import so each analysis is a single regex scan per feature.
+# The alternation is generated from the keyword set (longest first), so adding
+# keywords doesn't add extra passes over the text.
+SENSATIONAL_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(word) for word in sorted(SENSATIONAL_WORDS, key=lambda word: (-len(word), word))) + r")\b",
+    re.IGNORECASE
+)
+CAPS_RE = re.compile(r"\b[A-Z]{3,}\b")
+
+# Mock corrective links shown when the news is fake
+# Note: These are based on the example texts used for demonstration.
+CORRECTIVE_LINKS = [
+    {"title": "Fact-Check: Separating Science from Misinformation (Science Journal)", "url": "https://trustedscience.org/fact-check"},
+    {"title": "Official Statement on Economic Outlook (Federal Reserve)", "url": "https://federalreserve.gov/latest-reports"},
+    {"title": "Understanding Clickbait Language: A Guide to Media Literacy", "url": "https://medialiteracy.org/clickbait-guide"}
+]
 
+
+@st.cache_data(max_entries=128, show_spinner=False)
 def detect_fake_news_mock(text):
     """
     Simulates the model prediction process and generates mock corrective links.
     (0 = Fake News, 1 = Real News)
+    Also returns the word count so callers don't need to re-tokenize the text.
     """
-    if not text:
-        return 0, 0.5, [] # Default probability for empty text
-
-    sensational_words = ["shocking", "bombshell", "must-see", "disaster", "urgent alert", "massive cover-up", "secretly", "experts agree", "share this immediately", "reveals all", "exposed", "scandal", "breaking now", "lie", "fraud"]
-    sensational_count = sum(1 for word in sensational_words if word in text.lower())
-    all_caps_words = sum(1 for word in text.split() if word.isupper() and len(word) > 2)
     word_count = len(text.split())
+    if word_count == 0:
+        return 0, 0.5, [], 0 # Default probability for empty text
+
+    # Very short texts are dominated by the length penalty, so skip the feature scans
+    if word_count < 3:
+        sensational_count = 0
+        all_caps_words = 0
+    else:
+        sensational_count = len(SENSATIONAL_RE.findall(text))
+        all_caps_words = len(CAPS_RE.findall(text))
     
     prob_real = 0.5
     prob_real -= (sensational_count * 0.08)
     
-    if word_count > 0:
-        caps_ratio = all_caps_words / word_count
-        prob_real -= (caps_ratio * 0.3)
+    caps_ratio = all_caps_words / word_count
+    prob_real -= (caps_ratio * 0.3)
     
     if word_count < 100:
         prob_real -= 0.15 
@@ -153,18 +130,29 @@ def detect_fake_news_mock(text):
     
     if prediction == 0:
         # Generate mock corrective links when the news is fake
-        # Note: These are based on the example texts used for demonstration.
-        corrective_links = [
-            {"title": "Fact-Check: Separating Science from Misinformation (Science Journal)", "url": "https://trustedscience.org/fact-check"},
-            {"title": "Official Statement on Economic Outlook (Federal Reserve)", "url": "https://federalreserve.gov/latest-reports"},
-            {"title": "Understanding Clickbait Language: A Guide to Media Literacy", "url": "https://medialiteracy.org/clickbait-guide"}
-        ]
+        corrective_links = CORRECTIVE_LINKS
     
-    return prediction, prob_real, corrective_links
+    return prediction, prob_real, corrective_links, word_count
 
 
 # --- 3. UI COMPONENTS & LOGIC ---
 
+def build_links_html(links):
+    """Renders a list of links as a styled HTML list."""
+    return "<ul style='list-style-type: none; padding-left: 0;'>" + "".join(
+        f"""
+        <li style="margin-bottom: 10px;" class="correction-link">
+            <span style="color: #484f58;">•</span> 
+            <a href="{link['url']}" target="_blank">{link['title']}</a>
+        </li>
+        """
+        for link in links
+    ) + "</ul>"
+
+# The mock links are static, so their HTML is rendered once at import
+CORRECTIVE_LINKS_HTML = build_links_html(CORRECTIVE_LINKS)
+
+
 def display_corrective_links(links):
     """Displays the list of corrective, non-fake news links."""
     if not links:
@@ -180,56 +168,54 @@ def display_corrective_links(links):
     )
     
     # Use an HTML list with custom styling for mock links
-    link_html = "<ul style='list-style-type: none; padding-left: 0;'>"
-    for link in links:
-        link_html += f"""
-        <li style="margin-bottom: 10px;" class="correction-link">
-            <span style="color: #484f58;">•</span> 
-            <a href="{link['url']}" target="_blank">{link['title']}</a>
-        </li>
-        """
-    link_html += "</ul>"
-    
+    link_html = CORRECTIVE_LINKS_HTML if links == CORRECTIVE_LINKS else build_links_html(links)
     st.markdown(link_html, unsafe_allow_html=True)
 
 
-def display_result(prediction, confidence, corrective_links):
-    """Displays the result badge, Fakiness Score, and calls for corrective links."""
-    
-    label = "REAL NEWS" if prediction == 1 else "FAKE NEWS"
-    
-    if prediction == 1:
-        color = "#28a745"  # Green
-        emoji = "✅"
-        score_label = "Confidence Score"
-        score_value = f"{confidence * 100:.2f}%"
-        message = "The model suggests this article is likely **authentic and factual**. It exhibits characteristics consistent with verified reports."
-    else:
-        color = "#dc3545"  # Red
-        emoji = "❌"
-        score_label = "Fakiness Score"
-        # Calculate Fakiness Score
-        fakiness_score = (1 - confidence) * 100
-        score_value = f"{fakiness_score:.2f}%"
-        message = "The model suggests this article contains **misinformation or is fabricated**. It shows signs of sensationalism or stylistic inconsistencies."
-
-    
-    # Streamlit Markdown with HTML/CSS for the Result Card
-    st.markdown(f"""
+def build_card_template(label, color, emoji, score_label, message):
+    """Builds a result card HTML template with a {score} placeholder for the score value."""
+    return f"""
     <div style="background-color: #161b22; border: 1px solid {color}; padding: 25px; border-radius: 12px; margin-top: 30px; box-shadow: 0 0 20px rgba(0, 0, 0, 0.6);">
         <h2 style="color: {color}; border-bottom: none; margin-top: 0; padding-bottom: 0; text-align: center;">
             {emoji} FINAL VERDICT: {label} {emoji}
         </h2>
         <div style="text-align: center; margin-top: 15px;">
             <span style="font-size: 1.5rem; font-weight: bold; color: {color};">
-                {score_label}: {score_value}
+                {score_label}: {{score}}
             </span>
         </div>
         <p style="font-size: 1.05rem; margin-top: 20px; text-align: center; font-style: italic; color: #a0a0a0;">
             {message} **Always verify critical information through multiple trusted, independent sources.**
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+# Only two verdicts exist, so both result cards are pre-formatted at import
+REAL_CARD_TEMPLATE = build_card_template(
+    "REAL NEWS", "#28a745", "✅", "Confidence Score",  # Green
+    "The model suggests this article is likely **authentic and factual**. It exhibits characteristics consistent with verified reports."
+)
+FAKE_CARD_TEMPLATE = build_card_template(
+    "FAKE NEWS", "#dc3545", "❌", "Fakiness Score",  # Red
+    "The model suggests this article contains **misinformation or is fabricated**. It shows signs of sensationalism or stylistic inconsistencies."
+)
+
+
+def display_result(prediction, confidence, corrective_links):
+    """Displays the result badge, Fakiness Score, and calls for corrective links."""
+    
+    if prediction == 1:
+        card_template = REAL_CARD_TEMPLATE
+        score_value = f"{confidence * 100:.2f}%"
+    else:
+        card_template = FAKE_CARD_TEMPLATE
+        # Calculate Fakiness Score
+        fakiness_score = (1 - confidence) * 100
+        score_value = f"{fakiness_score:.2f}%"
+    
+    # Streamlit Markdown with HTML/CSS for the Result Card
+    st.markdown(card_template.format(score=score_value), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -238,10 +224,10 @@ def display_result(prediction, confidence, corrective_links):
         display_corrective_links(corrective_links)
 
 
-def setup_sidebar():
-    """Sets up the left sidebar for instructions and details."""
-    st.sidebar.markdown(
-        """
+@st.cache_data
+def sidebar_markdown():
+    """Returns the invariant Markdown shown in the sidebar."""
+    return """
         # ℹ️ How It Works
         
         **News Shield** uses a simplified machine learning approach to analyze linguistic and stylistic features of news text.
@@ -266,12 +252,30 @@ def setup_sidebar():
         
         **Technique (Simulated):** Linguistic Heuristics based on features like sensational keywords and capitalization.
         """
-    )
+
+
+def setup_sidebar():
+    """Sets up the left sidebar for instructions and details."""
+    st.sidebar.markdown(sidebar_markdown())
+
+
+FAKE_EXAMPLE = "URGENT ALERT: Scientists confirm that drinking lemon water at exactly 3:00 AM reverses aging completely. The findings were based on a study of a single mouse, but experts agree this is the MOST SHOCKING discovery of the decade! Share this immediately!"
+REAL_EXAMPLE = "On Thursday, the Federal Reserve announced it would keep its benchmark interest rate target unchanged, holding steady in the range of 5.25% to 5.50%. This decision follows a period of stable inflation data and a tightening labor market, suggesting a cautious but optimistic outlook on economic recovery."
+
+
+def load_example(example_text):
+    """Button callback that fills the text area with an example article.
+
+    Callbacks run before the script reruns, so the widget picks up the new
+    value without needing a second st.rerun().
+    """
+    st.session_state.news_input_key = example_text
 
 
 def main_app():
     """Main Streamlit application function."""
     
+    st.markdown(load_css(), unsafe_allow_html=True)
     setup_sidebar()
 
     st.title("News Shield: AI-Powered News Authenticity Scanner 🔍")
@@ -281,66 +285,48 @@ def main_app():
     st.markdown("---")
 
     # --- Input Area (Single Column for better responsiveness) ---
+    # The form only submits on 'Analyze', so typing in the text area doesn't trigger reruns
     
-    current_news_text = st.text_area(
-        "📰 Enter News Article Text Here:",
-        key="news_input_key", 
-        height=300,
-        placeholder="E.g., 'SHOCKING new report reveals that all local politicians are secretly aliens! The evidence, which is completely unverified, was found in a dusty pamphlet last Tuesday...'"
-    )
-
-    # --- Action Buttons ---
+    st.session_state.setdefault("news_input_key", "")
+    with st.form("analyze_form", clear_on_submit=False, border=False):
+        current_news_text = st.text_area(
+            "📰 Enter News Article Text Here:",
+            key="news_input_key", 
+            height=300,
+            placeholder="E.g., 'SHOCKING new report reveals that all local politicians are secretly aliens! The evidence, which is completely unverified, was found in a dusty pamphlet last Tuesday...'"
+        )
+        detect_button = st.form_submit_button("🚀 Analyze Article", type="primary", use_container_width=True)
+
+    # --- Example Buttons (outside the form, they update the text area directly) ---
     
-    col_analyze, col_fake, col_real = st.columns([1.5, 1, 1])
+    col_fake, col_real = st.columns(2)
 
-    with col_analyze:
-        detect_button = st.button("🚀 Analyze Article", type="primary", use_container_width=True)
-    
     with col_fake:
-        example_button_fake = st.button("Load Fake Example", key="load_fake_example", use_container_width=True)
+        st.button("Load Fake Example", key="load_fake_example", on_click=load_example, args=(FAKE_EXAMPLE,), use_container_width=True)
     
     with col_real:
-        example_button_real = st.button("Load Real Example", key="load_real_example", use_container_width=True)
-        
-    # Handle Example Loading (Update the text input widget via st.session_state)
-    if example_button_fake:
-        st.session_state.news_input_key = "URGENT ALERT: Scientists confirm that drinking lemon water at exactly 3:00 AM reverses aging completely. The findings were based on a study of a single mouse, but experts agree this is the MOST SHOCKING discovery of the decade! Share this immediately!"
-        st.rerun()
-    
-    if example_button_real:
-        st.session_state.news_input_key = "On Thursday, the Federal Reserve announced it would keep its benchmark interest rate target unchanged, holding steady in the range of 5.25% to 5.50%. This decision follows a period of stable inflation data and a tightening labor market, suggesting a cautious but optimistic outlook on economic recovery."
-        st.rerun()
+        st.button("Load Real Example", key="load_real_example", on_click=load_example, args=(REAL_EXAMPLE,), use_container_width=True)
 
     # --- Analysis Logic ---
     if detect_button:
-        if not current_news_text:
+        if not current_news_text.strip():
             st.error("⚠️ Please paste an article into the text box before analyzing.")
-            return
+            st.stop()
 
-        # 1. Show Loading/Progress
-        st.info("Analyzing content... please wait.")
-        progress_bar = st.progress(0)
-        
-        # Simulate processing time
-        for i in range(100):
-            time.sleep(0.01)
-            progress_bar.progress(i + 1)
-        
-        progress_bar.empty()
-        
-        # 2. Get Prediction, Confidence, and Corrective Links
-        prediction, confidence, corrective_links = detect_fake_news_mock(current_news_text)
+        # 1. Get Prediction, Confidence, and Corrective Links (spinner is rendered client-side)
+        with st.spinner("Analyzing content... please wait."):
+            prediction, confidence, corrective_links, word_count = detect_fake_news_mock(current_news_text)
 
-        # 3. Display Result and Corrective Links
+        # 2. Display Result and Corrective Links
         display_result(prediction, confidence, corrective_links)
 
-        # 4. Display Technical Details in an Expander
+        # 3. Display Technical Details in an Expander
         st.markdown("---")
         with st.expander("🔬 Detailed Model Interpretation", expanded=False):
             st.markdown(f"""
             This section provides the underlying data used for the verdict.
             
-            * **Word Count:** {len(current_news_text.split())} words
+            * **Word Count:** {word_count} words
             * **Sensational Keyword Density (Enhanced Check):** High counts of keywords like 'SHOCKING', 'URGENT', or 'BOMBSHELL' correlates with lower authenticity.
             * **Capitalization Index (Enhanced Check):** Checks for excessive ALL-CAPS words (e.g., 'URGENT ALERT') which strongly suggests clickbait or ragebait.
             